@@ -50,7 +50,7 @@ class AWSService:
             login_msg = f"Successfully logged in to ECR registry: {credentials['registry']}"
             logs.append(login_msg)
             self.logger.info(login_msg)
-            self.logger.debug(f""
+            self.logger.debug(f"""
                 ECR Login Details:
                 Username: {credentials['username']}
                 Registry: {credentials['registry']}
@@ -1,6 +1,6 @@
 import logging
 import re
-from typing import Dict, List, Optional
+from typing import Dict
 import docker
 
 class DockerService:
@@ -13,6 +13,13 @@ class DockerService:
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
+        self._client = None
+
+    def _get_client(self) -> docker.DockerClient:
+        """Return the shared Docker client, creating it on first use"""
+        if self._client is None:
+            self._client = docker.from_env()
+        return self._client
 
     def analyze_dockerfile(self, dockerfile_path: str) -> Dict[str, any]:
         """
@@ -116,7 +123,7 @@ class DockerService:
         self.logger.info(f"Building Docker image with tag: {sanitized_image_tag}")
         logs = []
         try:
-            client = docker.from_env()
+            client = self._get_client()
             # Build the image and capture logs
             logs.append(f"Starting build for image: {sanitized_image_tag}")
             build_output = client.images.build(
@@ -178,44 +185,11 @@ class DockerService:
                 'logs': logs
             }
 
-    def tag_image_for_ecr(self, image_id: str, account_id: str, region: str, repo_name: str, tag: str = "latest") -> str:
-        """Tag a Docker image for ECR repository using account, region, and repo name"""
-        try:
-            # Form the ECR repository URL
-            ecr_repo = f"{account_id}.dkr.ecr.{region}.amazonaws.com/{repo_name}"
-            ecr_tag = f"{ecr_repo}:{tag}"
-            self.logger.info(f"Tagging image {image_id} for ECR: {ecr_tag}")
-            client = docker.from_env()
-            image = client.images.get(image_id)
-            image.tag(ecr_tag)
-            self.logger.info(f"Successfully tagged image: {ecr_tag}")
-            return ecr_tag
-        except docker.errors.ImageNotFound:
-            self.logger.error(f"Image not found: {image_id}")
-            raise
-        except Exception as e:
-            self.logger.error(f"Error tagging image: {str(e)}")
-            raise
-
-    def build_and_tag_for_ecr(self, context_path: str, dockerfile_path: str, image_tag: str, account_id: str, region: str, repo_name: str) -> Dict[str, any]:
-        """Build Docker image and tag it for ECR using account, region, and repo name"""
-        build_result = self.build_image(context_path, dockerfile_path, image_tag)
-        if not build_result.get('image_id'):
-            return build_result
-
-        try:
-            ecr_tag = self.tag_image_for_ecr(build_result['image_id'], account_id, region, repo_name, image_tag)
-            build_result['ecr_tag'] = ecr_tag
-        except Exception as e:
-            build_result['error'] = f"ECR tagging failed: {str(e)}"
-            build_result['ecr_tag'] = None
-
-        return build_result
     def tag_image_for_ecr(self, image_id: str, ecr_repo: str, tag: str = "latest") -> str:
         """Tag a Docker image for ECR repository"""
         self.logger.info(f"Tagging image {image_id} for ECR: {ecr_repo}:{tag}")
         try:
-            client = docker.from_env()
+            client = self._get_client()
             image = client.images.get(image_id)
             ecr_tag = f"{ecr_repo}:{tag}"
             image.tag(ecr_tag)
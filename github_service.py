@@ -15,6 +15,19 @@ formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(messag
 handler.setFormatter(formatter)
 logger.addHandler(handler)
 
+# README file names checked, in order, when parsing build/run commands
+README_FILENAMES = ("README.md", "readme.md", "Readme.md")
+
+# Fenced shell blocks following common build/run keywords
+BUILD_COMMAND_PATTERN = re.compile(
+    r'(?:build|install|compile|make).*?```(?:bash|shell)?\n(.*?)\n```',
+    re.IGNORECASE | re.DOTALL
+)
+RUN_COMMAND_PATTERN = re.compile(
+    r'(?:run|start|execute|launch).*?```(?:bash|shell)?\n(.*?)\n```',
+    re.IGNORECASE | re.DOTALL
+)
+
 class GitHubRepoAnalysisModel(BaseModel):
     """Model to store GitHub repository analysis results"""
     repo_url: str
@@ -109,29 +122,22 @@ class GitHubService:
 
     def parse_readme(self, local_path: str) -> dict:
         """Parse README.md for build and run commands"""
-        readme_path = [
-            os.path.join(local_path, "README.md"),
-            os.path.join(local_path, "readme.md"),
-            os.path.join(local_path, "Readme.md")
-        ]
-
         build_commands = []
         run_commands = []
 
-        for path in readme_path:
+        for filename in README_FILENAMES:
+            path = os.path.join(local_path, filename)
             if os.path.exists(path):
                 try:
                     with open(path, 'r', encoding='utf-8') as f:
                         content = f.read()
 
                         # Look for build commands (common keywords)
-                        build_pattern = r'(?:build|install|compile|make).*?```(?:bash|shell)?\n(.*?)\n```'
-                        build_matches = re.findall(build_pattern, content, re.IGNORECASE | re.DOTALL)
+                        build_matches = BUILD_COMMAND_PATTERN.findall(content)
                         build_commands = [cmd.strip() for match in build_matches for cmd in match.split('\n') if cmd.strip()]
 
                         # Look for run commands (common keywords)
-                        run_pattern = r'(?:run|start|execute|launch).*?```(?:bash|shell)?\n(.*?)\n```'
-                        run_matches = re.findall(run_pattern, content, re.IGNORECASE | re.DOTALL)
+                        run_matches = RUN_COMMAND_PATTERN.findall(content)
                         run_commands = [cmd.strip() for match in run_matches for cmd in match.split('\n') if cmd.strip()]
 
                         logger.info(f"Found {len(build_commands)} build commands and {len(run_commands)} run commands in README")
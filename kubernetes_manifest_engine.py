@@ -1,5 +1,11 @@
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict
+
+# Prefer the libyaml-backed emitter; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
 
 class KubernetesManifestEngine:
     """Generates Kubernetes Deployment, Service, and Ingress manifests"""
@@ -55,7 +61,7 @@ class KubernetesManifestEngine:
                 }
             }
         }
-        return yaml.dump(deployment, sort_keys=False)
+        return yaml.dump(deployment, Dumper=SafeDumper, sort_keys=False)
 
     @staticmethod
     def generate_service(
@@ -83,7 +89,7 @@ class KubernetesManifestEngine:
                 "type": service_type
             }
         }
-        return yaml.dump(service, sort_keys=False)
+        return yaml.dump(service, Dumper=SafeDumper, sort_keys=False)
 
     @staticmethod
     def generate_ingress(
@@ -137,4 +143,4 @@ class KubernetesManifestEngine:
                 "secretName": tls_secret
             }]
 
-        return yaml.dump(ingress, sort_keys=False)
+        return yaml.dump(ingress, Dumper=SafeDumper, sort_keys=False)
@@ -1,11 +1,11 @@
 import logging
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from models import APIRequestModel
 from ai_service import AIService
 import time
 import json
-from exceptions import AppBaseError, InfrastructureProvisioningError, ApplicationBuildError, ConfigurationError, UserInputValidationError
+from exceptions import AppBaseError
 
 # Configure structured logging
 logging.basicConfig(level=logging.INFO)
@@ -1,4 +1,4 @@
-from typing import Literal, Optional, List, Union
+from typing import Literal, Optional, List
 from pydantic import BaseModel
 
 class APIRequestModel(BaseModel):
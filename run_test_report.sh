@@ -0,0 +1,11 @@
+#!/bin/bash
+set -e
+
+# Run from the repository root so tests/ and the top-level modules resolve
+cd "$(dirname "$0")"
+
+# Optional test path argument, relative to the repository root
+TEST_PATH="${1:-tests}"
+
+# Run the tests and report the 20 slowest (at least 50ms each)
+python -m pytest -q "$TEST_PATH" --durations=20 --durations-min=0.05
@@ -1,12 +1,17 @@
 import re
 import logging
-from typing import Optional
+from typing import Optional, Pattern, Union
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Allowed-character patterns, compiled once at import
+TERRAFORM_PATTERN = re.compile(r'^[a-zA-Z0-9_\.\-]+$')
+KUBERNETES_PATTERN = re.compile(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$')
+SHELL_PATTERN = re.compile(r'^[a-zA-Z0-9_\.\-\/\:= ]+$')
+
 def validate_and_sanitize(input_str: str,
-                         pattern: str,
+                         pattern: Union[str, Pattern[str]],
                          max_length: int = 64,
                          context: str = "general") -> Optional[str]:
     """
@@ -24,7 +29,9 @@ def validate_and_sanitize(input_str: str,
         return None
 
     # Validate pattern
-    if not re.fullmatch(pattern, input_str):
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    if not pattern.fullmatch(input_str):
         logger.warning(f"Input validation failed in {context}: "
                       f"'{input_str[:30]}...' contains invalid characters. "
                       f"Input rejected.")
@@ -40,7 +47,7 @@ def sanitize_terraform_input(input_str: str, max_length: int = 64) -> Optional[s
     """
     return validate_and_sanitize(
         input_str,
-        r'^[a-zA-Z0-9_\.\-]+$',
+        TERRAFORM_PATTERN,
         max_length,
         "Terraform"
     )
@@ -53,7 +60,7 @@ def sanitize_kubernetes_input(input_str: str, max_length: int = 63) -> Optional[
     """
     return validate_and_sanitize(
         input_str,
-        r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$',
+        KUBERNETES_PATTERN,
         max_length,
         "Kubernetes"
     )
@@ -66,7 +73,7 @@ def sanitize_shell_input(input_str: str, max_length: int = 256) -> Optional[str]
     """
     return validate_and_sanitize(
         input_str,
-        r'^[a-zA-Z0-9_\.\-\/\:= ]+$',
+        SHELL_PATTERN,
         max_length,
         "Shell"
     )
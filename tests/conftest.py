@@ -0,0 +1,16 @@
+import logging
+import pytest
+
+# Loggers whose records nothing reads during tests
+QUIET_LOGGERS = ("security_utils",)
+
+@pytest.fixture(autouse=True)
+def quiet_loggers():
+    """Raise noisy module loggers to CRITICAL for the duration of each test"""
+    loggers = [logging.getLogger(name) for name in QUIET_LOGGERS]
+    levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.CRITICAL)
+    yield
+    for logger, level in zip(loggers, levels):
+        logger.setLevel(level)
@@ -1,30 +1,16 @@
 import pytest
 from security_utils import sanitize_terraform_input, sanitize_kubernetes_input
 
-def test_sanitize_terraform_input_invalid():
-    input_str = "test!@#string"
-    assert sanitize_terraform_input(input_str) is None
+SANITIZE_CASES = [
+    # (sanitizer, input_str, expected)
+    pytest.param(sanitize_terraform_input, "test!@#string", None, id="terraform-invalid"),
+    pytest.param(sanitize_kubernetes_input, "test!@#string", None, id="kubernetes-invalid"),
+    pytest.param(sanitize_terraform_input, "test-string_with.dot", "test-string_with.dot", id="terraform-valid"),
+    pytest.param(sanitize_kubernetes_input, "test-string-with.dot", "test-string-with.dot", id="kubernetes-valid"),
+    pytest.param(sanitize_terraform_input, "", "", id="terraform-empty"),
+    pytest.param(sanitize_kubernetes_input, "", "", id="kubernetes-empty"),
+]
 
-def test_sanitize_kubernetes_input_invalid():
-    input_str = "test!@#string"
-    assert sanitize_kubernetes_input(input_str) is None
-
-def test_sanitize_terraform_input_valid():
-    input_str = "test-string_with.dot"
-    expected = "test-string_with.dot"
-    assert sanitize_terraform_input(input_str) == expected
-
-def test_sanitize_kubernetes_input_valid():
-    input_str = "test-string-with.dot"
-    expected = "test-string-with.dot"
-    assert sanitize_kubernetes_input(input_str) == expected
-
-def test_sanitize_terraform_input_empty():
-    input_str = ""
-    expected = ""
-    assert sanitize_terraform_input(input_str) == expected
-
-def test_sanitize_kubernetes_input_empty():
-    input_str = ""
-    expected = ""
-    assert sanitize_kubernetes_input(input_str) == expected
+@pytest.mark.parametrize("sanitizer, input_str, expected", SANITIZE_CASES)
+def test_sanitize_input(sanitizer, input_str, expected):
+    assert sanitizer(input_str) == expected